@@ -9,7 +9,8 @@ app itself, and are only shortcuts.
 
 """
 
-from evennia.utils.search import search_tag
+from evennia.objects.models import ObjectDB
+from evennia.utils.utils import lazy_property
 
 ## Mix-in
 
@@ -31,20 +32,30 @@ class ContactMixin:
     Instance methods:
         get_phone_number: return the phone number of an object, if available.
         find_phone: return the phone linked to a given phone number.
+        find_phones: return the phones linked to several phone numbers.
         format: format a phone number, giving its contact name if possible.
+        format_many: format several phone numbers, reading contacts once.
+        get_contact_name: return the display name of a contact.
+        clean_phone_number: return a phone number without dashes.
         search: search a name and return matching phone numbers if found.
 
     """
 
-    @property
+    @lazy_property
     def phone_number(self):
-        """Shortcut, return the phone number of the app object."""
+        """Shortcut, return the phone number of the app object.
+
+        The phone number is cached for the life of the app object,
+        which is re-created every time the device is used.
+
+        """
         return self.get_phone_number(pretty=False)
 
     @property
     def pretty_phone_number(self):
         """Shortcut, return the pretty phone number of the app object."""
-        return self.get_phone_number(pretty=True)
+        number = self.phone_number
+        return number[:3] + "-" + number[3:]
 
     def get_phone_number(self, pretty=False, obj=None):
         """Return the phone number of this object, if found.
@@ -77,9 +88,35 @@ class ContactMixin:
             phone_number (str): the phone number.
 
         """
-        phones = search_tag(phone_number, category="phone number")
+        phones = self.find_phones([phone_number])
         return phones[0] if phones else None
 
+    def find_phones(self, phone_numbers):
+        """Return the objects linked to any of these phone numbers.
+
+        Contrary to calling `find_phone` for each phone number, this
+        method only sends one query, whatever the number of phone
+        numbers to look for.  Phone number tags are stored as digits,
+        so they are matched exactly (`search_tag` matches tag keys
+        case-insensitively, which prevents the use of the tag key index).
+
+        Args:
+            phone_numbers (list of str): the phone numbers.
+
+        Returns:
+            phones (list of Object): the objects with these phone numbers,
+                    each object being returned only once, even if it
+                    has several of these phone numbers.
+
+        """
+        phone_numbers = [number.replace("-", "") for number in phone_numbers]
+        if not phone_numbers:
+            return []
+
+        return list(ObjectDB.objects.filter(db_tags__db_key__in=phone_numbers,
+                db_tags__db_category="phone number",
+                db_tags__db_tagtype__isnull=True).distinct())
+
     def format(self, phone_number, use_contact=True, obj=None):
         """Return the formatted phone number or contact name if found.
 
@@ -96,6 +133,47 @@ class ContactMixin:
         obj = obj or self.obj
         return self.format_obj(obj, phone_number, use_contact)
 
+    def format_many(self, phone_numbers, use_contact=True, obj=None):
+        """Format several phone numbers at once.
+
+        Contrary to calling `format` for each phone number, the contacts
+        are only read once.
+
+        Args:
+            phone_numbers (list of str): the phone numbers to format.
+            use_contact (bool, optional): use the contact to retrieve the names.
+            obj (Object, optional): the object to use for the contact
+                    app (will be `self` if not specified).
+
+        Returns:
+            names (dict): the display names or formatted phone numbers,
+                    with the specified phone numbers as keys.
+
+        Raises:
+            ValueError: one of the phone numbers is invalid.
+
+        """
+        obj = obj or self.obj
+        contacts = {}
+        if use_contact:
+            for contact in self.get_contacts(obj):
+                number = contact.get("phone_number")
+                if number and number not in contacts:
+                    contacts[number] = ContactMixin.get_contact_name(contact)
+
+        names = {}
+        for phone_number in phone_numbers:
+            if phone_number in names:
+                continue
+
+            number = ContactMixin.clean_phone_number(phone_number)
+            name = contacts.get(number)
+            if name is None:
+                name = number[:3] + "-" + number[3:]
+            names[phone_number] = name
+
+        return names
+
     def search(self, name_or_number, obj=None):
         """Search for a phone number, giving a name or number.
 
@@ -113,31 +191,20 @@ class ContactMixin:
         """
         obj = obj or self.obj
         matches = []
+        query = name_or_number.lower()
 
         # Find the contact app and query the specified number or name
-        contacts = obj.attributes.get(
-                "_type_storage", {}).get(
-                "computer", {}).get(
-                "app_storage", {}).get(
-                "app", {}).get(
-                "contact", {}).get(
-                "contacts", [])
-        for contact in contacts:
+        for contact in ContactMixin.get_contacts(obj):
             # Skip contacts without phone numbers
             if not contact.get("phone_number"):
                 continue
 
-            first = contact.get("first_name", "")
-            last = contact.get("last_name", "")
-            name = first
-            if name:
-                name += " "
-            name += last
-            if name.lower() == name_or_number.lower():
+            first = contact.get("first_name", "").lower()
+            last = contact.get("last_name", "").lower()
+            name = ContactMixin.get_contact_name(contact).lower()
+            if name == query:
                 return [contact["phone_number"]]
-            elif last.lower().startswith(name_or_number.lower()):
-                matches.append(contact["phone_number"])
-            elif first.lower().startswith(name_or_number.lower()):
+            elif last.startswith(query) or first.startswith(query):
                 matches.append(contact["phone_number"])
 
         if matches:
@@ -149,6 +216,69 @@ class ContactMixin:
             else:
                 return []
 
+    @staticmethod
+    def get_contacts(obj):
+        """Return the contacts stored in the object's contact app.
+
+        Args:
+            obj (Object): the object in which the contact app must be sought.
+
+        Returns:
+            contacts (list of dict): the contacts, an empty list if none.
+
+        """
+        return obj.attributes.get(
+                "_type_storage", {}).get(
+                "computer", {}).get(
+                "app_storage", {}).get(
+                "app", {}).get(
+                "contact", {}).get(
+                "contacts", [])
+
+    @staticmethod
+    def get_contact_name(contact):
+        """Return the display name of a contact.
+
+        Args:
+            contact (dict): the contact, as stored in the contact app.
+
+        Returns:
+            name (str): the first and last names, separated by a space.
+
+        """
+        first = contact.get("first_name", "")
+        last = contact.get("last_name", "")
+        return first + " " + last if first else last
+
+    @staticmethod
+    def clean_phone_number(phone_number):
+        """Return the phone number without dashes.
+
+        Phone numbers read from the database are unicode, they are
+        converted to str.
+
+        Args:
+            phone_number (str or unicode): the phone number to clean.
+
+        Returns:
+            phone_number (str): the phone number (7 digits).
+
+        Raises:
+            ValueError: the phone number is invalid.
+
+        """
+        number = phone_number
+        if isinstance(number, basestring):
+            try:
+                number = str(number.replace("-", ""))
+            except UnicodeEncodeError:
+                pass
+
+        if not isinstance(number, str) or not number.isdigit() or len(number) != 7:
+            raise ValueError("the specified phone number is invalid: {}".format(phone_number))
+
+        return number
+
     @staticmethod
     def format_obj(obj, phone_number, use_contact=True):
         """Format the specified phone number.
@@ -162,30 +292,12 @@ class ContactMixin:
             name (str): the formatted phone number or contact name if found.
 
         """
-        # Remove dashes from the phone number
-        if isinstance(phone_number, str):
-            phone_number = phone_number.replace("-", "")
-
-        if not isinstance(phone_number, str) or not phone_number.isdigit() or len(phone_number) != 7:
-            raise ValueError("the specified phone number is invalid: {}".format(phone_number))
+        phone_number = ContactMixin.clean_phone_number(phone_number)
 
         # Find a contact with this phone number
         if use_contact:
-            contacts = obj.attributes.get(
-                    "_type_storage", {}).get(
-                    "computer", {}).get(
-                    "app_storage", {}).get(
-                    "app", {}).get(
-                    "contact", {}).get(
-                    "contacts", [])
-            for contact in contacts:
+            for contact in ContactMixin.get_contacts(obj):
                 if contact.get("phone_number") == phone_number:
-                    first = contact.get("first_name", "")
-                    last = contact.get("last_name", "")
-                    name = first
-                    if name:
-                        name += " "
-                    name += last
-                    return name
+                    return ContactMixin.get_contact_name(contact)
 
         return phone_number[:3] + "-" + phone_number[3:]
@@ -17,6 +17,12 @@ from world.log import app as log
 
 ## Constants
 NET = None
+MAIN_HEADER = dedent("""
+    AvenOS 12.0            [6G]           [Bluetooth]           [96%}
+""".lstrip("\n")) + "\n    "
+MAIN_FOOTER = dedent("""
+    Enter the first letters to open this app.  Type |hEXIT|n to quit the interface."
+""".lstrip("\n"))
 
 class BaseApp(object):
 
@@ -56,7 +62,7 @@ class BaseApp(object):
         return storage[self.app_name]
 
     @classmethod
-    def notify(cls, obj, title, message="", content="", screen=None, db=None, group=None):
+    def notify(cls, obj, title, message="", content="", screen=None, db=None, group=None, coalesce=False):
         """Send a message to the owner of the app if needed.
 
         This method is called when a notificaiton has to be sent.
@@ -74,6 +80,8 @@ class BaseApp(object):
             screen (str or Screen, optional): the screen's path (default to the app's start screen).
             db (dict, optional): the optional arguments to give to the screen.
             group (str, optional): the notification group.
+            coalesce (bool, optional): replace a pending notification
+                    of the same group, rather than adding one.
 
         Note:
             Notifications are defined in the app because it might be
@@ -116,7 +124,7 @@ class BaseApp(object):
             user.msg(to_send)
         else:
             # If no current user, add a notification
-            type.notifications.add(title, screen, app, folder, content=content, db=db, group=group)
+            type.notifications.add(title, screen, app, folder, content=content, db=db, group=group, coalesce=coalesce)
 
     @classmethod
     def forget_notification(cls, obj, group=None):
@@ -529,9 +537,7 @@ class MainScreen(BaseScreen):
 
     def get_text(self):
         """Display the installed apps."""
-        string = dedent("""
-            AvenOS 12.0            [6G]           [Bluetooth]           [96%}
-        """.lstrip("\n")) + "\n    "
+        string = MAIN_HEADER
         i = 0
         for app in self.type.apps:
             if i > 0 and i % 4 == 0:
@@ -541,9 +547,7 @@ class MainScreen(BaseScreen):
             string += "{name}".format(name=self.format_cmd(text, strip_ansi(app.display_name).lower(), upper=False))
             string += " " * (15 - len(no_ansi_text))
 
-        string = string.rstrip(" ") + "\n\n" + dedent("""
-            Enter the first letters to open this app.  Type |hEXIT|n to quit the interface."
-        """.lstrip("\n"))
+        string = string.rstrip(" ") + "\n\n" + MAIN_FOOTER
         return string
 
     def no_match(self, string):
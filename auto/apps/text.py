@@ -45,14 +45,109 @@ Note:
 
 from textwrap import dedent, wrap
 
-from evennia import search_tag
-from evennia.utils.evtable import EvTable
-from evennia.utils.utils import crop, lazy_property
+from evennia.utils.utils import crop, delay, lazy_property
 
 
 from auto.apps._mixins import ContactMixin
 from auto.apps.base import BaseApp, BaseScreen, AppCommand
-from web.text.models import Text, Thread, Number
+from web.text.models import Text, Thread, Number, format_ago, get_gametime
+
+## Constants
+WRAP_CACHE_SIZE = 4096
+
+# A row in the list of threads: status, index (right-aligned by the
+# padding), sender (20 characters), content (35 characters), time since.
+# The index and status contain markup, hence their manual alignment.
+THREAD_ROW = "%s %s%s %-20s %-35s %s"
+_WRAPPED = {}
+
+NEW_TEXT_TEMPLATE = dedent("""
+    New message
+
+    From: {}
+      To: {}
+
+    Text message (use {clear} to clear your current text):
+        {}
+
+        {send}                                             {cancel}
+""".strip("\n"))
+
+THREAD_TEMPLATE = dedent("""
+    Messages with {}
+    |lccontact|ltCONTACT|le to edit the contact for this conversation.
+
+    {}
+
+    Text message (use {clear} to clear your current text):
+        {}
+
+        {send}
+""".strip("\n"))
+
+## Functions
+
+def cached_wrap(content, width):
+    """Wrap the content, caching the result.
+
+    Texts don't change once sent, and screens are displayed again
+    whenever their user types a line, so the same texts tend to be
+    wrapped over and over.  The cache is emptied when it grows too big.
+
+    Args:
+        content (str): the content to wrap.
+        width (int): the maximum width of a line.
+
+    Returns:
+        lines (tuple of str): the wrapped lines.
+
+    """
+    key = (content, width)
+    lines = _WRAPPED.get(key)
+    if lines is None:
+        if len(_WRAPPED) >= WRAP_CACHE_SIZE:
+            _WRAPPED.clear()
+        lines = _WRAPPED[key] = tuple(wrap(content, width))
+
+    return lines
+
+def format_message(sender, content, ago):
+    """Return a text message as displayed in a thread.
+
+    Args:
+        sender (str): the name of the sender.
+        content (str): the text content.
+        ago (str): the time since the text was sent.
+
+    Returns:
+        message (str): the message, wrapped under the sender's name.
+
+    """
+    sender = "|c" + sender + "|n"
+    content = cached_wrap(content + " (" + ago + ")", 75 - len(sender) - 3)
+    return sender + ": " + ("\n" + (len(sender) + 2) * " ").join(content)
+
+def notify_recipients(app, text_id):
+    """Notify the devices of the recipients of a text.
+
+    Every device is notified once, and the sending device isn't
+    notified at all.  This function is called in a delayed task by
+    `CmdSend`, so that sending a text to a large group doesn't make
+    the sender wait.
+
+    Args:
+        app (TextApp): the text app of the sending device.
+        text_id (int): the ID of the text that was sent.
+
+    """
+    text = Text.objects.get(id=text_id)
+    notified = set([app.obj.id])
+    for device in app.find_phones(text.recipients):
+        if device.id in notified:
+            continue
+
+        notified.add(device.id)
+        NewTextScreen.notify(device, text)
 
 ## App class
 
@@ -129,51 +224,50 @@ class MainScreen(BaseScreen):
             return
 
         # Load the threads (conversations) to which "number" participated
-        threads = Text.objects.get_threads_for(number)
-        string = "Texts for {}".format(pretty_number)
-        string += "\n"
+        threads, count = Text.objects.get_threads_and_count_for(number)
+        lines = ["Texts for {}".format(pretty_number)]
         self.db["threads"] = {}
         stored_threads = self.db["threads"]
         if threads:
             len_i = 3 if len(threads) < 100 else 4
-            string += "  Create a {new} message.\n".format(new=self.format_cmd("new"))
+            lines.append("  Create a {new} message.".format(new=self.format_cmd("new")))
+            lines.append("")
             i = 1
-            table = EvTable(pad_left=0, border="none")
-            table.add_column("S", width=2)
-            table.add_column("I", width=len_i, align="r", valign="t")
-            table.add_column("Sender", width=21)
-            table.add_column("Content", width=36)
-            table.add_column("Ago", width=15)
-            for thread_id, text in threads.items():
+            now = get_gametime()
+            thread_recipients = [(text, text.recipients) for text in threads.values()]
+            names = self.app.format_many(set(num for text, numbers in thread_recipients for num in numbers))
+            for text, numbers in thread_recipients:
                 thread = text.db_thread
                 stored_threads[i] = thread
-                sender = text.recipients
-                sender = [self.app.format(num) for num in sender]
-                sender = ", ".join(sender)
+                recipients = ", ".join(names[num] for num in numbers)
                 if thread.name:
-                    sender = thread.name
-                sender = crop(sender, 20, "")
+                    recipients = thread.name
+                recipients = crop(recipients, 20, "")
 
                 content = text.content.replace("\n", "  ")
                 if text.sender.db_phone_number == number:
                     content = "[You] " + content
                 content = crop(content, 35)
-                status = " " if thread.has_read(number) else "|rU|n"
-                table.add_row(status, self.format_cmd(str(i)), sender, content, text.sent_ago.capitalize())
+                # Use the prefetched readers rather than querying each thread
+                readers = [reader.db_phone_number for reader in thread.db_read.all()]
+                status = " " if number in readers else "|rU|n"
+                index = str(i)
+                padding = " " * (len_i - 1 - len(index))
+                row = THREAD_ROW % (status, padding, self.format_cmd(index), recipients, content, text.sent_ago_from(now).capitalize())
+                lines.append(row.rstrip())
                 i += 1
-            lines = str(table).splitlines()
-            del lines[0]
-            lines = [line.rstrip() for line in lines]
-            string += "\n" + "\n".join(lines)
-            string += "\n\n(Type a number to open this text.)"
+            lines.append("")
+            lines.append("(Type a number to open this text.)")
         else:
-            string += "\n  You have no texts yet.  Want to create a {new} one?".format(new=self.format_cmd("new"))
+            lines.append("")
+            lines.append("  You have no texts yet.  Want to create a {new} one?".format(new=self.format_cmd("new")))
 
-        string += "\n\n(Enter {settings} to edit the app settings).".format(settings=self.format_cmd("settings"))
-        count = Text.objects.get_texts_for(number).count()
+        lines.append("")
+        lines.append("(Enter {settings} to edit the app settings).".format(settings=self.format_cmd("settings")))
         s = "" if count == 1 else "s"
-        string += "\n\nText app: {} saved message{s}.".format(count, s=s)
-        return string
+        lines.append("")
+        lines.append("Text app: {} saved message{s}.".format(count, s=s))
+        return "\n".join(lines)
 
     def no_match(self, string):
         """Method called when no command matches the user input.
@@ -239,25 +333,14 @@ class NewTextScreen(BaseScreen):
         """Display the new message screen."""
         number = self.app.phone_number
         pretty_number = self.app.pretty_phone_number
-        screen = """
-            New message
-
-            From: {}
-              To: {}
-
-            Text message (use {clear} to clear your current text):
-                {}
-
-                {send}                                             {cancel}
-        """
-        recipients = list(self.db.get("recipients", []))
-        for i, recipient in enumerate(recipients):
-            recipients[i] = self.app.format(recipient)
+        recipients = self.db.get("recipients") or ()
+        names = self.app.format_many(recipients)
+        recipients = [names[recipient] for recipient in recipients]
 
         content = self.db.get("content", "(type your text here)")
-        content = "\n    ".join(wrap(content, 75))
+        content = "\n    ".join(cached_wrap(content, 75))
         recipients = ", ".join(recipients)
-        return screen.format(number, recipients, content, clear=self.format_cmd("clear"), send=self.format_cmd("send"), cancel=self.format_cmd("cancel"))
+        return NEW_TEXT_TEMPLATE.format(number, recipients, content, clear=self.format_cmd("clear"), send=self.format_cmd("send"), cancel=self.format_cmd("cancel"))
 
     def no_match(self, string):
         """Command no match, to write the text content."""
@@ -296,7 +379,7 @@ class NewTextScreen(BaseScreen):
         content = text.content
         screen = "auto.apps.text.ThreadScreen"
         db = {"thread": text.thread}
-        TextApp.notify(obj, title, message, content, screen, db, group)
+        TextApp.notify(obj, title, message, content, screen, db, group, coalesce=True)
 
     @staticmethod
     def forget_notification(obj, thread):
@@ -358,42 +441,27 @@ class ThreadScreen(BaseScreen):
         thread.mark_read(number)
         NewTextScreen.forget_notification(self.obj, thread)
 
-        screen = dedent("""
-            Messages with {}
-            |lccontact|ltCONTACT|le to edit the contact for this conversation.
-
-            {}
-
-            Text message (use {clear} to clear your current text):
-                {}
-
-                {send}
-        """.strip("\n"))
-        texts = list(reversed(thread.text_set.order_by("db_date_sent").reverse()[:10]))
+        # Only the sender, content and date of the texts are needed
+        texts = thread.text_set.order_by("-db_date_sent").values_list(
+                "db_sender__db_phone_number", "db_content", "db_date_sent")[:10]
+        texts = list(reversed(texts))
+        # The recipients are usually prefetched when coming from the main screen
+        recipients = [o.db_phone_number for o in thread.db_recipients.all()]
+        recipients = [recipient for recipient in recipients if recipient != number]
+        names = self.app.format_many(set(recipients).union(
+                sender for sender, _, _ in texts))
 
         # Browse the list of texts in this thread
-        messages = []
-        for text in texts:
-            sender = text.sender
-            if sender.db_phone_number == number:
-                sender = "You"
-            else:
-                sender = self.app.format(sender.db_phone_number)
-            sender = "|c" + sender + "|n"
-
-            content = text.content + " (" + text.sent_ago + ")"
-            content = wrap(content, 75 - len(sender) - 3)
-            content = ("\n" + (len(sender) + 2) * " ").join(content)
-            messages.append(sender + ": " + content)
+        now = get_gametime()
+        messages = "\n".join(format_message("You" if sender == number else names[sender],
+                content, format_ago(date_sent, now)) for sender, content, date_sent in texts)
 
         content = self.db.get("content", "(type your text here)")
-        content = "\n    ".join(wrap(content, 75))
-        recipients = [o.db_phone_number for o in thread.db_recipients.exclude(db_phone_number=number)]
+        content = "\n    ".join(cached_wrap(content, 75))
         self.db["recipients"] = recipients
-        recipients = [self.app.format(number) for number in recipients]
+        recipients = [names[number] for number in recipients]
         recipients = ", ".join(recipients)
-        messages = "\n".join(messages)
-        return screen.format(recipients, messages, content, clear=self.format_cmd("clear"), send=self.format_cmd("send"))
+        return THREAD_TEMPLATE.format(recipients, messages, content, clear=self.format_cmd("clear"), send=self.format_cmd("send"))
 
     def no_match(self, string):
         """Command no match, to write the text content."""
@@ -520,7 +588,7 @@ class CmdSend(AppCommand):
         """Execute the command."""
         screen = self.screen
         sender = screen.app.phone_number
-        recipients = list(screen.db.get("recipients", []))
+        recipients = screen.db.get("recipients") or ()
         if not recipients:
             self.msg("You haven't specified at least one recipient.")
             screen.display()
@@ -541,11 +609,8 @@ class CmdSend(AppCommand):
         else:
             del screen.db["content"]
 
-        # Notify the recipients
-        for number in text.recipients:
-            devices = search_tag(number, category="phone number")
-            for device in devices:
-                NewTextScreen.notify(device, text)
+        # Notify the recipients without making the sender wait
+        delay(0, notify_recipients, screen.app, text.id)
 
 
 class CmdCancel(AppCommand):
@@ -620,12 +685,14 @@ class CmdTo(AppCommand):
         if "recipients" not in screen.db:
             screen.db["recipients"] = []
         recipients = screen.db["recipients"]
-        if number in recipients:
-            recipients.remove(number)
-            self.msg("This contact was removed from the list of recipients.")
-        else:
+        try:
+            index = recipients.index(number)
+        except ValueError:
             recipients.append(number)
             self.msg("This contact was added to the list of recipients.")
+        else:
+            del recipients[index]
+            self.msg("This contact was removed from the list of recipients.")
         screen.display()
 
 
@@ -674,7 +741,7 @@ class CmdContact(AppCommand):
     def func(self):
         """Execute the command."""
         screen = self.screen
-        recipients = list(screen.db.get("recipients", []))
+        recipients = screen.db.get("recipients") or ()
         if not recipients:
             self.msg("There are no recipient in this conversation yet.  Use the |hTO|n command to add recipients.")
             return
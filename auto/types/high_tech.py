@@ -90,7 +90,10 @@ def return_appearance(type, looker, number=False, header=""):
     if notifications:
         text += "\n\n"
         for notification in notifications:
-            title = crop(notification.title, 55, "...")
+            title = notification.title
+            if notification.count > 1:
+                title = "({}) {}".format(notification.count, title)
+            title = crop(title, 55, "...")
             content = "\n    ".join(wrap(notification.content, 74))
             text += "\n-   {:<55} ({})".format(title, notification.ago)
             if content:
@@ -364,6 +367,10 @@ class NotificationHandler(object):
             db["notifications"] = []
         return db["notifications"]
 
+    def count(self):
+        """Return the number of notifications."""
+        return len(self.db)
+
     def all(self):
         """Return all notifications."""
         notifications = []
@@ -375,7 +382,7 @@ class NotificationHandler(object):
 
         return notifications
 
-    def add(self, title, screen, app, folder="app", content="", db=None, group=None):
+    def add(self, title, screen, app, folder="app", content="", db=None, group=None, coalesce=False):
         """Add a new notificaiton.
 
         Args:
@@ -386,12 +393,18 @@ class NotificationHandler(object):
             content (str, optional): the content of the notification.
             db (dict, optional): db attributes to give to the screen.
             group (str, optional): a group identifier [1].
+            coalesce (bool, optional): merge with a notification of the same group [2].
 
         [1] Notifications can be grouped using a group identifier.  Notifications
             that have this identifier can be removed.  This is useful in
             some apps that want to remove notifications based on certain
             actions: for instance, if you mark a text as read in the text
             app, you want to remove the unread notification for this thread.
+        [2] If `coalesce` is set and a notification with the same group
+            is still pending, this notification is replaced by the new one,
+            which keeps count of the merged notifications and is placed
+            last, like any new notification.  This avoids
+            piling up notifications for a busy text thread, for instance.
 
         """
         timestamp = gametime.gametime(absolute=True)
@@ -404,11 +417,25 @@ class NotificationHandler(object):
                 "db": db,
                 "group": group,
                 "timestamp": timestamp,
+                "count": 1,
         }
+
+        index = None
+        if coalesce and group is not None:
+            for i, info in enumerate(self.db):
+                if info.get("group") == group:
+                    index = i
+                    kwargs["count"] = info.get("count", 1) + 1
+                    break
+
         notification = Notification(**kwargs)
         notification.obj = self.obj
         notification.handler = self
+        # A merged notification is moved last, to keep the notifications sorted
+        if index is not None:
+            del self.db[index]
         self.db.append(kwargs)
+
         return notification
 
     def clear(self, group=None):
@@ -418,20 +445,21 @@ class NotificationHandler(object):
             group (str, optional): the optional name of the group to clear.
 
         """
+        # Every change to the stored list is saved, so change it only once
         if group is None:
-            while self.db:
-                del self.db[0]
+            if self.db:
+                del self.db[:]
         elif self.db:
-            for kwargs in list(self.db):
-                if kwargs.get("group") == group:
-                    self.db.remove(kwargs)
+            kept = [kwargs for kwargs in self.db if kwargs.get("group") != group]
+            if len(kept) < len(self.db):
+                self.db[:] = kept
 
 
 class Notification(object):
 
     """A class to represent a notification."""
 
-    def __init__(self, title, screen, app, folder="app", content="", timestamp=None, db=None, group=None):
+    def __init__(self, title, screen, app, folder="app", content="", timestamp=None, db=None, group=None, count=1):
         self.title = title
         self.screen = screen
         self.app = app
@@ -440,6 +468,7 @@ class Notification(object):
         self.timestamp = timestamp
         self.db = db
         self.group = group
+        self.count = count
         self.obj = None
         self.handler = None
 
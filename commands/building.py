@@ -2,20 +2,94 @@
 
 """This file contains the commands for builders."""
 
+import re
 from textwrap import dedent
 
 from evennia import ObjectDB
 from evennia.commands.default.muxcommand import MuxCommand
 from evennia.utils.create import create_object
 from evennia.utils.logger import log_trace
-from evennia.utils.utils import class_from_module, inherits_from
+from evennia.utils.utils import class_from_module, dbref, inherits_from
 from evennia.contrib.unixcommand import UnixCommand
-from auto.types.typehandler import TYPES
 from commands.command import Command
 from logic.geo import NAME_DIRECTIONS, coords_in, coords, get_direction
-from typeclasses.prototypes import PRoom, PObj
-from typeclasses.rooms import Room
-from typeclasses.vehicles import Crossroad
+
+# Global imports
+_CROSSROAD = None
+_PROOM = None
+_ROOM = None
+_TYPES = None
+
+# Direction number and information by direction name or alias
+_DIRECTION_INFO = dict((name, (direction, get_direction(direction))) for
+        name, direction in NAME_DIRECTIONS.items())
+
+# Field, optional /add or /del operation, and object name of the @ command
+_FIELD_RE = re.compile(r"^(?P<field>\S+?)(?:/(?P<op>add|del))?(?:\s+(?P<obj>.*))?$",
+        re.IGNORECASE)
+
+# Classes already loaded from their Python path
+_CLASSES = {}
+
+def _load_class(path):
+    """Return the class at this Python path, importing it only once.
+
+    Args:
+        path (str): the Python path of the class to load.
+
+    Returns:
+        cls (type): the loaded class.
+
+    Raises:
+        Any exception raised by `class_from_module` on the first load.
+
+    """
+    cls = _CLASSES.get(path)
+    if cls is None:
+        cls = _CLASSES[path] = class_from_module(path)
+
+    return cls
+
+def _resolve_object(caller, name):
+    """Search for a single object, around the caller or in the game.
+
+    Objects around the caller are preferred.  If none matches or the
+    name is ambiguous, a global search is performed, which also reports
+    the error to the caller.  A #dbref is directly searched globally.
+
+    Args:
+        caller (Object): the object searching.
+        name (str): the name or #dbref of the object to find.
+
+    Returns:
+        obj (Object or None): the found object, or None.
+
+    """
+    if dbref(name) is None:
+        objs = caller.search(name, quiet=True)
+        if objs and len(objs) == 1:
+            return objs[0]
+
+    return caller.search(name, global_search=True)
+
+# Epilogs of the sub-commands, built from their docstring
+_EPILOGS = {}
+
+def _get_epilog(method):
+    """Return the dedented docstring of a method, dedenting it only once.
+
+    Args:
+        method (method): the method whose docstring should be returned.
+
+    Returns:
+        epilog (str): the dedented and stripped docstring.
+
+    """
+    epilog = _EPILOGS.get(method.__name__)
+    if epilog is None:
+        epilog = _EPILOGS[method.__name__] = dedent(method.__doc__).strip()
+
+    return epilog
 
 class CmdBuildingMenu(Command):
 
@@ -41,13 +115,9 @@ class CmdBuildingMenu(Command):
         # Search for the actual object
         args = self.args.strip()
         if args:
-            objs = self.caller.search(args, quiet=True)
-            if not objs or len(objs) > 1:
-                obj = self.caller.search(args, global_search=True)
-                if not obj:
-                    return
-            else:
-                obj = objs[0]
+            obj = _resolve_object(self.caller, args)
+            if not obj:
+                return
         else:
             obj = self.caller.location
 
@@ -58,7 +128,7 @@ class CmdBuildingMenu(Command):
             return
 
         try:
-            menu_class = class_from_module(menu_class)
+            menu_class = _load_class(menu_class)
         except Exception:
             log_trace("Cannot load the building menu: {}".format(menu_class))
             return
@@ -106,17 +176,17 @@ class CmdEdit(MuxCommand):
 
     def func(self):
         """Main function for this command."""
-        field_name, sep, obj_name = self.lhs.partition(" ")
-        field_name = field_name.lower()
-        operation = "get"
-        if field_name.endswith("/add"):
-            field_name = field_name[:-4]
-            operation = "add"
-        elif field_name.endswith("/del"):
-            field_name = field_name[:-4]
-            operation = "del"
-        elif self.rhs:
-            operation = "set"
+        match = _FIELD_RE.match(self.lhs)
+        if match:
+            field_name, operation, obj_name = match.group("field", "op", "obj")
+            field_name = field_name.lower()
+        else:
+            field_name, operation, obj_name = "", None, ""
+
+        if operation:
+            operation = operation.lower()
+        else:
+            operation = "set" if self.rhs else "get"
 
         if not obj_name:
             obj_name = field_name
@@ -127,13 +197,9 @@ class CmdEdit(MuxCommand):
             return
 
         # Search for the actual object
-        objs = self.caller.search(obj_name, quiet=True)
-        if not objs or len(objs) > 1:
-            obj = self.caller.search(obj_name, global_search=True)
-            if not obj:
-                return
-        else:
-            obj = objs[0]
+        obj = _resolve_object(self.caller, obj_name)
+        if not obj:
+            return
 
         # Get the representation value for this object type
         repr = getattr(type(obj), "repr", None)
@@ -141,7 +207,7 @@ class CmdEdit(MuxCommand):
             self.msg("This object has no representation to describe it.")
             return
 
-        repr = class_from_module(repr)
+        repr = _load_class(repr)
         repr = repr(obj)
         repr.process(self.caller, field_name, self.rhs, operation)
 
@@ -167,13 +233,43 @@ class CmdNew(UnixCommand):
     locks = "cmd:id(1) or perm(Builders)"
     help_category = "Building"
 
+    # Sub-commands and the name of the method building their parser
+    subcommands = (
+            ("room", "build_room_parser"),
+            ("pobj", "build_pobj_parser"),
+            ("obj", "build_obj_parser"),
+    )
+
     def init_parser(self):
-        """Configure the parser and sub-commands."""
-        subparsers = self.parser.add_subparsers()
+        """Configure the parser.
+
+        Sub-command parsers are only built when needed, see
+        `add_subparsers`.
 
-        # @new room
-        room = subparsers.add_parser("room", help="add a room",
-                epilog=dedent(self.create_room.__doc__).strip())
+        """
+        self.subparsers = self.parser.add_subparsers()
+        self.built = set()
+
+    def add_subparsers(self, name=None):
+        """Build the parser of the given sub-command if needed.
+
+        Args:
+            name (str, optional): the sub-command name.  If not set
+                    or not a valid sub-command, build all parsers,
+                    so that the help and errors can list them.
+
+        """
+        subcommands = type(self).subcommands
+        build_all = name not in [subcommand for subcommand, _ in subcommands]
+        for subcommand, method in subcommands:
+            if subcommand not in self.built and (build_all or subcommand == name):
+                getattr(self, method)()
+                self.built.add(subcommand)
+
+    def build_room_parser(self):
+        """Build the parser of @new room."""
+        room = self.subparsers.add_parser("room", help="add a room",
+                epilog=_get_epilog(self.create_room))
         room.add_argument("exit", nargs="?",
                 help="the exit in which to create the room")
         room.add_argument("-h", "--help", action="store_true",
@@ -187,9 +283,10 @@ class CmdNew(UnixCommand):
         room.set_defaults(func=self.create_room)
         room.set_defaults(parser=room)
 
-        # @new pobj
-        pobj = subparsers.add_parser("pobj", help="add an object prototype",
-                epilog=dedent(self.create_pobj.__doc__).strip())
+    def build_pobj_parser(self):
+        """Build the parser of @new pobj."""
+        pobj = self.subparsers.add_parser("pobj", help="add an object prototype",
+                epilog=_get_epilog(self.create_pobj))
         pobj.add_argument("key", nargs="?",
                 help="the key of the object prototype to create")
         pobj.add_argument("-h", "--help", action="store_true",
@@ -198,9 +295,10 @@ class CmdNew(UnixCommand):
         pobj.set_defaults(func=self.create_pobj)
         pobj.set_defaults(parser=pobj)
 
-        # @new obj
-        obj = subparsers.add_parser("obj", help="add an object",
-                epilog=dedent(self.create_obj.__doc__).strip())
+    def build_obj_parser(self):
+        """Build the parser of @new obj."""
+        obj = self.subparsers.add_parser("obj", help="add an object",
+                epilog=_get_epilog(self.create_obj))
         obj.add_argument("key", nargs="+",
                 help="the key of the object to create")
         obj.add_argument("-h", "--help", action="store_true",
@@ -210,6 +308,17 @@ class CmdNew(UnixCommand):
         obj.set_defaults(func=self.create_obj)
         obj.set_defaults(parser=obj)
 
+    def parse(self):
+        """Build the needed sub-command parser before parsing."""
+        words = self.args.split(None, 1)
+        self.add_subparsers(words[0] if words else None)
+        super(CmdNew, self).parse()
+
+    def get_help(self, caller, cmdset):
+        """Return the help, listing all sub-commands."""
+        self.add_subparsers()
+        return super(CmdNew, self).get_help(caller, cmdset)
+
     def func(self):
         if self.opts.help:
             self.msg(self.opts.parser.format_help())
@@ -241,28 +350,37 @@ class CmdNew(UnixCommand):
           |w@new room n -r gray street|n
 
         """
+        global _CROSSROAD, _PROOM, _ROOM
+        if not _CROSSROAD:
+            from typeclasses.vehicles import Crossroad as _CROSSROAD
+        if not _PROOM:
+            from typeclasses.prototypes import PRoom as _PROOM
+        if not _ROOM:
+            from typeclasses.rooms import Room as _ROOM
+
         # Default parameters are set to None and modified by the context of the caller
         exit = direction = x = y = z = n_x = n_y = n_z = origin = road = None
+        already = None
+        checked = False
         road_name = " ".join(args.road)
         prototype = None
         if args.prototype:
             prototype = " ".join(args.prototype)
 
             # Try to find the prototype
-            try:
-                prototype = PRoom.objects.get(db_key=prototype)
-            except PRoom.DesNotExist:
+            found = _PROOM.objects.filter(db_key=prototype).first()
+            if found is None:
                 self.msg("The prototype {} doesn't exist.".format(prototype))
                 return
+            prototype = found
 
         # Do some common checks
         info = {}
         if args.exit:
-            if args.exit not in NAME_DIRECTIONS:
+            if args.exit not in _DIRECTION_INFO:
                 self.msg("Invalid direction name: {}.".format(args.exit))
                 return
-            direction = NAME_DIRECTIONS[args.exit]
-            info = get_direction(direction)
+            direction, info = _DIRECTION_INFO[args.exit]
             exit = info["name"]
 
         # If caller is in road building mode, use its location
@@ -271,8 +389,8 @@ class CmdNew(UnixCommand):
             x = building["x"]
             y = building["y"]
             z = building["z"]
-            room = Room.get_room_at(x, y, z)
-            closest, street, exits = Crossroad.get_street(x, y, z)
+            room = _ROOM.get_room_at(x, y, z)
+            closest, street, exits = _CROSSROAD.get_street(x, y, z)
 
             # If in a room in road building mode, take this room as the origin
             if room:
@@ -286,8 +404,8 @@ class CmdNew(UnixCommand):
                         return
 
                     n_x, n_y, n_z = entry["coordinates"]
-                    entry["name"] = street
-                    road = entry
+                    checked = True  # get_street already looked for this room
+                    road = (street, entry["numbers"])
                 else:
                     self.msg("This direction ({}) isn't a side of this road: {}.".format(
                             exit, street))
@@ -314,34 +432,23 @@ class CmdNew(UnixCommand):
                 n_x, n_y, n_z = args.coordinates
 
             if road_name == "AUTO":
-                roads = origin.tags.get(category="road")
-                roads = roads or []
-                roads = [roads] if isinstance(roads, basestring) else roads
-                for name in roads:
-                    # Get all coordinates for this road
-                    coordinates = Crossroad.get_road_coordinates(name,
-                            include_road=False, include_crossroads=False)
-                    if (n_x, n_y, n_z) in coordinates:
-                        road = {
-                                "name": name,
-                                "numbers": coordinates[(n_x, n_y, n_z)],
-                        }
+                for name in origin.roads:
+                    numbers = _CROSSROAD.get_road_number_at(name, n_x, n_y, n_z)
+                    if numbers is not None:
+                        road = (name, numbers)
                         break
             elif road_name != "NONE":
                 # Look for the road name
-                coordinates = Crossroad.get_road_coordinates(road_name,
-                        include_road=False, include_crossroads=False)
-                if (n_x, n_y, n_z) in coordinates:
-                    road = {
-                            "name": road_name,
-                            "numbers": coordinates[(n_x, n_y, n_z)],
-                    }
+                numbers = _CROSSROAD.get_road_number_at(road_name, n_x, n_y, n_z)
+                if numbers is not None:
+                    road = (road_name, numbers)
                 else:
                     self.msg("Cannot find the road named '{}'.".format(
                             road_name))
 
         # Check that the new coordinates are not already used
-        already = Room.get_room_at(n_x, n_y, n_z)
+        if not checked:
+            already = _ROOM.get_room_at(n_x, n_y, n_z)
         if already is not None:
             self.msg("A room ({}) already exists here, X+{} Y={} Z={}.".format(
                     already.key, n_x, n_y, n_z))
@@ -358,35 +465,48 @@ class CmdNew(UnixCommand):
         self.msg("Creating a new room: {}(#{}) (X={}, Y={}, Z={}).".format(
                 room.key, room.id, n_x, n_y, n_z))
         if road:
-            name = road["name"]
-            numbers = road["numbers"]
+            name, numbers = road
             self.msg("Adding addresses {} {} to the new room.".format(
                     "-".join(str(n) for n in numbers), name))
             room.add_address(numbers, name)
 
         # Create the exits if needed
-        if exit and origin:
-            if any(e.name == exit for e in origin.exits):
-                self.msg("There already is an exit {} in the room {}.".format(
-                        exit, origin.key))
-            else:
-                aliases = info["aliases"]
-                create_object("typeclasses.exits.Exit", exit, origin,
-                               aliases=aliases, destination=room)
-                self.msg("Created {} exit from {} to {}.".format(
-                        exit, origin.key, room.key))
+        if info and origin:
+            self.create_paired_exits(origin, room, info, new=not prototype)
+
+    def create_paired_exits(self, origin, room, info, new=False):
+        """
+        Create the exit from origin to room and the one leading back.
+
+        Args:
+            origin (Room): the room from which the exit starts.
+            room (Room): the destination.
+            info (dict): the direction information, as returned by
+                    `get_direction`.
+            new (bool, optional): whether room has just been created
+                    without any exit.
+
+        """
+        exit_class = _load_class("typeclasses.exits.Exit")
+        exit = info["name"]
+        if exit in {e.name for e in origin.exits}:
+            self.msg("There already is an exit {} in the room {}.".format(
+                    exit, origin.key))
+        else:
+            create_object(exit_class, exit, origin,
+                           aliases=info["aliases"], destination=room)
+            self.msg("Created {} exit from {} to {}.".format(
+                    exit, origin.key, room.key))
 
         # Creating the back exit
-        if info and origin:
-            back = info["opposite_name"]
-            if any(e.name == back for e in room.exits):
-                self.msg("There already is an exit {} in the room {}.".format(
-                        back, room.key))
-            else:
-                aliases = info["opposite_aliases"]
-                create_object("typeclasses.exits.Exit", back, room,
-                               aliases=aliases, destination=origin)
-                self.msg("Created {} exit from {} to {}.".format(back, room.key, origin.key))
+        back = info["opposite_name"]
+        if not new and back in {e.name for e in room.exits}:
+            self.msg("There already is an exit {} in the room {}.".format(
+                    back, room.key))
+        else:
+            create_object(exit_class, back, room,
+                           aliases=info["opposite_aliases"], destination=origin)
+            self.msg("Created {} exit from {} to {}.".format(back, room.key, origin.key))
 
     def create_pobj(self, args):
         """
@@ -410,6 +530,10 @@ class CmdNew(UnixCommand):
         and |y@types/remove|n.
 
         """
+        global _TYPES
+        if not _TYPES:
+            from auto.types.typehandler import TYPES as _TYPES
+
         # Check that the key doesn't already exist
         key = args.key.strip().lower()
 
@@ -417,12 +541,10 @@ class CmdNew(UnixCommand):
             self.msg("|ySpecify at least a key for this object prototype.|n")
             return
 
-        try:
-            obj = ObjectDB.objects.get(db_key=key)
-        except ObjectDB.DoesNotExist:
-            pass
-        else:
-            self.msg("|rThe specified key ({}) is already being used by #{}.".format(key, obj.id))
+        existing_id = ObjectDB.objects.filter(db_key=key).values_list(
+                "id", flat=True).first()
+        if existing_id is not None:
+            self.msg("|rThe specified key ({}) is already being used by #{}.".format(key, existing_id))
             return
 
         types = args.types
@@ -434,7 +556,7 @@ class CmdNew(UnixCommand):
 
         # Check that the type exists
         for name in types:
-            if name not in TYPES:
+            if name not in _TYPES:
                 self.msg("|rThe specified type name ({}) doesn't exist.|n".format(name))
                 return
 
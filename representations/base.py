@@ -5,6 +5,9 @@
 from evennia.utils.evform import EvForm
 from evennia.utils.evtable import EvTable
 
+# Maximum number of rendered forms kept per representation class
+FORM_CACHE_SIZE = 100
+
 class BaseRepr(object):
 
     """Abstract representation."""
@@ -13,6 +16,14 @@ class BaseRepr(object):
     to_display = []
     form = None
 
+    # Operations supported by `process` and the method performing them
+    operations = {
+            "get": "_do_get",
+            "set": "_do_set",
+            "add": "_do_add",
+            "del": "_do_del",
+    }
+
     def __init__(self, obj):
         self.obj = obj
 
@@ -38,55 +49,98 @@ class BaseRepr(object):
         if not field:
             return self.display(caller)
 
-        if value and field in type(self).fields and operation in ("set", "add", "del"):
-            to_type = type(self).fields[field]
+        cls = type(self)
+        method = cls.operations.get(operation)
+        if method is None:
+            return
+
+        if value and operation != "get" and field in cls.fields:
+            to_type = cls.fields[field]
             try:
                 value = to_type(value)
             except ValueError:
                 caller.msg("Invalid value for {}: {}.".format(field, value))
                 return
 
-        # Different operations
-        if operation == "set":
-            if hasattr(self, "set_{}".format(field)):
-                getattr(self, "set_{}".format(field))(caller, value)
+        getattr(self, method)(caller, field, value)
+
+    def _do_get(self, caller, field, value):
+        """Display the current value of a field."""
+        handler = self._resolve_handler("get_", field)
+        if handler is not None:
+            value = handler(self, caller)
+        else:
+            value = getattr(self.obj, field)
+        caller.msg("Current value {} = {} for {}.".format(
+                field, value, self.obj.get_display_name(caller)))
+
+    def _do_set(self, caller, field, value):
+        """Set the value of a field."""
+        handler = self._resolve_handler("set_", field)
+        if handler is not None:
+            handler(self, caller, value)
+        else:
+            setattr(self.obj, field, value)
+            caller.msg("New value {} = {} for {}.".format(field, value, self.obj))
+
+    def _do_add(self, caller, field, value):
+        """Add a value to a list or tuple field."""
+        handler = self._resolve_handler("add_", field)
+        if handler is not None:
+            handler(self, caller, value)
+        else:
+            old = getattr(self.obj, field)
+            if isinstance(old, list):
+                old.append(value)
+            elif isinstance(old, tuple):
+                setattr(self.obj, field, old + (value, ))
             else:
-                setattr(self.obj, field, value)
-                caller.msg("New value {} = {} for {}.".format(field, value, self.obj))
-        elif operation == "add":
-            if hasattr(self, "add_{}".format(field)):
-                getattr(self, "add_{}".format(field))(caller, value)
+                raise ValueError("I don't know what to make of this type.")
+            caller.msg("New value {} added to {} for {}.".format(value, field, self.obj))
+
+    def _do_del(self, caller, field, value):
+        """Remove a value from a list or tuple field."""
+        handler = self._resolve_handler("del_", field)
+        if handler is not None:
+            handler(self, caller, value)
+        else:
+            old = getattr(self.obj, field)
+            if isinstance(old, list):
+                setattr(self.obj, field, [e for e in old if e != value])
+            elif isinstance(old, tuple):
+                setattr(self.obj, field, tuple(e for e in old if e != value))
             else:
-                old = getattr(self.obj, field)
-                if isinstance(old, list):
-                    old.append(value)
-                elif isinstance(old, tuple):
-                    setattr(self.obj, field, old + (value, ))
-                else:
-                    raise ValueError("I don't know what to make of this type.")
-                caller.msg("New value {} added to {} for {}.".format(value, field, self.obj))
+                raise ValueError("I don't know what to make of this type.")
 
-            operation = "get"
-        elif operation == "del":
-            if hasattr(self, "del_{}".format(field)):
-                getattr(self, "del_{}".format(field))(caller, value)
-            else:
-                old = getattr(self.obj, field)
-                if isinstance(old, list):
-                    setattr(self.obj, field, [e for e in old if e != value])
-                elif isinstance(old, tuple):
-                    setattr(self.obj, field, tuple(e for e in old if e != value))
-                else:
-                    raise ValueError("I don't know what to make of this type.")
+            caller.msg("Value {} removed from {} for {}.".format(value, field, self.obj))
 
-                caller.msg("Value {} removed from {} for {}.".format(value, field, self.obj))
-        elif operation == "get":
-            if hasattr(self, "get_{}".format(field)):
-                value = getattr(self, "get_{}".format(field))(caller)
-            else:
-                value = getattr(self.obj, field)
-            caller.msg("Current value {} = {} for {}.".format(
-                    field, value, self.obj.get_display_name(caller)))
+    def _resolve_handler(self, prefix, field):
+        """Return the method `<prefix><field>` or None.
+
+        Methods are looked up once per class and kept in its
+        `_handlers` dictionary.
+
+        Args:
+            prefix (str): the method prefix, like 'get_' or 'set_'.
+            field (str): the field name.
+
+        Returns:
+            handler (function or None): the unbound method, to be
+                    called with the representation as first argument.
+
+        """
+        cls = type(self)
+        handlers = cls.__dict__.get("_handlers")
+        if handlers is None:
+            handlers = cls._handlers = {}
+
+        name = prefix + field
+        try:
+            handler = handlers[name]
+        except KeyError:
+            handler = handlers[name] = getattr(cls, name, None)
+
+        return handler
 
     def display(self, caller):
         """Display the object."""
@@ -94,17 +148,54 @@ class BaseRepr(object):
 
     def get_form(self, caller):
         """Return the formatted form."""
-        if type(self).form:
-            to_display = {}
-            for i, field in enumerate(type(self).to_display):
-                if hasattr(self, "get_{}".format(field)):
-                    value = getattr(self, "get_{}".format(field))(caller)
+        cls = type(self)
+        if cls.form:
+            values = []
+            for getter, parts in cls._get_display_accessors():
+                if getter is not None:
+                    value = getter(self, caller)
                 else:
                     value = self.obj
-                    for part in field.split("."):
+                    for part in parts:
                         value = getattr(value, part)
-                to_display[i + 1] = str(value)
-            return unicode(EvForm(form={"CELLCHAR": "x", "TABLECHAR": "c",
-                    "FORM": type(self).form}, cells=to_display))
+                values.append(str(value))
+
+            # Forms are parsed again on each rendering, keep the results
+            forms = cls.__dict__.get("_forms")
+            if forms is None:
+                forms = cls._forms = {}
+
+            key = tuple(values)
+            form = forms.get(key)
+            if form is None:
+                if len(forms) >= FORM_CACHE_SIZE:
+                    forms.clear()
+                form = forms[key] = unicode(EvForm(form={"CELLCHAR": "x",
+                        "TABLECHAR": "c", "FORM": cls.form},
+                        cells=dict(enumerate(key, 1))))
+
+            return form
         else:
             return "No display method has been provided for this object."
+
+    @classmethod
+    def _get_display_accessors(cls):
+        """Return the accessors of the fields to display.
+
+        The accessors are resolved once per class, the first time the
+        form is displayed.
+
+        Returns:
+            accessors (tuple): a tuple of `(getter, parts)` in form cell
+                    order, with `getter` being the unbound `get_<field>`
+                    method (or None), and `parts` the tuple of
+                    attribute names leading to the value on the object.
+
+        """
+        accessors = cls.__dict__.get("_display_accessors")
+        if accessors is None:
+            accessors = tuple((getattr(cls, "get_" + field, None),
+                    tuple(field.split("."))) for field in cls.to_display)
+            cls._display_accessors = accessors
+
+        return accessors
@@ -114,3 +114,38 @@ class TestContact(CommandTest):
         self.assertIsInstance(self.screen, app.MainScreen)
         self.execute_cmd(self.user, "back")
         self.assertIsInstance(self.screen, base.MainScreen)
+
+    def test_find_phones(self):
+        """Find several phones, some sharing or missing numbers."""
+        phone2 = self.prototype.create(key="another phone", location=self.room1)
+        phone3 = self.prototype.create(key="a third phone", location=self.room1)
+        number1 = self.phone1.types.get("phone").number
+        number2 = phone2.types.get("phone").number
+
+        # phone3 shares the number of phone2
+        phone3.tags.clear(category="phone number")
+        phone3.tags.add(number2, category="phone number")
+
+        # The apps are only created when the computer is used
+        computer = self.phone1.types.get("computer")
+        computer.apps.load(self.user)
+        text = computer.apps.get("text")
+
+        # A number without a phone is ignored
+        self.assertEqual(text.find_phones([]), [])
+        self.assertEqual(text.find_phones(["000-0000"]), [])
+
+        # Numbers are found with or without dashes
+        pretty1 = number1[:3] + "-" + number1[3:]
+        self.assertEqual(text.find_phones([pretty1, "000-0000"]), [self.phone1])
+
+        # Every phone sharing a number is found, only once
+        phones = text.find_phones([number1, number2, number2, "0000000"])
+        self.assertEqual(len(phones), 3)
+        self.assertEqual(set(phones), set([self.phone1, phone2, phone3]))
+
+        # A phone with several matching numbers is found only once
+        phone2.tags.add("5557171", category="phone number")
+        phones = text.find_phones([number2, "555-7171"])
+        self.assertEqual(len(phones), 2)
+        self.assertEqual(set(phones), set([phone2, phone3]))
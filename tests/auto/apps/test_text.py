@@ -13,7 +13,7 @@ from auto.apps import text as app
 from auto.apps import base
 from auto.types.high_tech import load_apps
 from commands.objects import CmdUse
-from web.text.models import Text, Thread
+from web.text.models import Number, Text, Thread
 
 class TestText(CommandTest):
 
@@ -223,6 +223,58 @@ class TestText(CommandTest):
         self.user.execute_cmd("back")
         self.assertIsInstance(self.screen, base.MainScreen)
 
+    def test_thread_from_db(self):
+        """Display a thread whose senders are read from the database."""
+        number = self.phone1.types.get("phone").number
+        Text.objects.send("2231818", [number], "Hello from the database")
+        Text.objects.send(number, ["2231818"], "Hello back")
+
+        # Make sure the numbers aren't taken from the idmapper cache
+        Number.flush_instance_cache(force=True)
+        Text.flush_instance_cache(force=True)
+        Thread.flush_instance_cache(force=True)
+        self.open()
+        self.assertIsInstance(self.screen, app.MainScreen)
+        self.user.execute_cmd("1")
+        self.assertIsInstance(self.screen, app.ThreadScreen)
+        text = self.screen.get_text()
+        self.assertIn("223-1818", text)
+        self.assertIn("Hello from the database", text)
+        self.assertIn("Hello back", text)
+
+    def test_notify_recipients(self):
+        """Notify the devices of the recipients of a text."""
+        phone2 = self.prototype.create(key="another phone", location=self.room1)
+        phone3 = self.prototype.create(key="a third phone", location=self.room1)
+        number1 = self.phone1.types.get("phone").number
+        number2 = phone2.types.get("phone").number
+        number3 = phone3.types.get("phone").number
+
+        # The apps are only loaded when the phone is used
+        self.open()
+        self.assertIsInstance(self.screen, app.MainScreen)
+        text_app = self.screen.app
+
+        # phone2 has two numbers, the sending phone has a second one
+        phone2.tags.add("5557171", category="phone number")
+        self.phone1.tags.add("5558282", category="phone number")
+        recipients = [number2, "5557171", number3, "5558282", "0000000"]
+        text = Text.objects.send(number1, recipients, "Hello everyone")
+        app.notify_recipients(text_app, text.id)
+
+        # The sending device isn't notified, even through its second number
+        notifications = self.phone1.types.has("notifications")[0].notifications
+        self.assertEqual(notifications.count(), 0)
+
+        # Every other device is notified only once
+        for phone in (phone2, phone3):
+            notifications = phone.types.has("notifications")[0].notifications
+            self.assertEqual(notifications.count(), 1)
+            notification = notifications.all()[0]
+            self.assertEqual(notification.content, "Hello everyone")
+            self.assertEqual(notification.count, 1)
+            self.assertEqual(notification.group, "text.thread.{}".format(text.thread.id))
+
     def test_contact(self):
         """Test the contact button on the ThreadScreen."""
         number = self.phone1.types.get("phone").number
@@ -39,3 +39,20 @@ class TestComputer(CommandTest):
         """Build and use a smart phone."""
         self.assertTrue(len(list(self.smartphone.types)) == 2)
 
+    def test_coalesce_notifications(self):
+        """Notifications of the same group can be merged."""
+        notifications = self.smartphone.types.get("computer").notifications
+        notifications.add("First", "auto.apps.text.MainScreen", "text", group="thread.1")
+        notifications.add("Second", "auto.apps.text.MainScreen", "text", group="thread.1", coalesce=True)
+        notifications.add("Other", "auto.apps.text.MainScreen", "text", group="thread.2", coalesce=True)
+        titles = [(n.title, n.count) for n in notifications.all()]
+        self.assertEqual(titles, [("Second", 2), ("Other", 1)])
+
+        # A merged notification is placed last
+        notifications.add("Third", "auto.apps.text.MainScreen", "text", group="thread.1", coalesce=True)
+        titles = [(n.title, n.count) for n in notifications.all()]
+        self.assertEqual(titles, [("Other", 1), ("Third", 3)])
+
+        # Without coalesce, notifications pile up
+        notifications.add("Fourth", "auto.apps.text.MainScreen", "text", group="thread.1")
+        self.assertEqual(len(notifications.all()), 3)
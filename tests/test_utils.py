@@ -79,3 +79,30 @@ class TestUtils(EvenniaTest):
         self.assertEqual(list(document.values())[9][1][0], 2)
         self.assertEqual(list(document.values())[9][1][1], 18)
         self.assertEqual(list(document.values())[9][2], {"field": (123, 19), "--begin": 19})
+
+    def test_latinify(self):
+        """Check that non-ASCII characters are replaced in a single pass."""
+        self.assertEqual(latinify(u"caf\xe9 ok"), u"caf? ok")
+        self.assertEqual(latinify(u"\xe9t\xe9 \xe0"), u"?t? ?")
+        self.assertEqual(latinify(u"\xe9t\xe9", replace=u"--"), u"--t--")
+        self.assertEqual(latinify(u"\xe9t\xe0", mapping={u"\xe9": u"e"}), u"et?")
+
+        # Keys of several characters and non-ASCII replacements
+        mapping = {u"e\u0301": u"e", u"\xe0": u"\xe2"}
+        self.assertEqual(latinify(u"e\u0301t\xe9 \xe0", mapping=mapping), u"et? ?")
+
+    def test_cached_property(self):
+        """Check that a cached property is computed once per instance."""
+        class Counter(object):
+            calls = 0
+
+            @cached_property
+            def value(self):
+                type(self).calls += 1
+                return [type(self).calls]
+
+        first, second = Counter(), Counter()
+        self.assertIs(first.value, first.value)
+        self.assertEqual(first.value, [1])
+        self.assertEqual(second.value, [2])
+        self.assertEqual(Counter.calls, 2)
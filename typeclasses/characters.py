@@ -10,7 +10,8 @@ creation commands.
 
 """
 
-from evennia.utils.utils import lazy_property
+from string import Formatter
+
 from evennia.contrib.ingame_python.typeclasses import EventCharacter
 from evennia.contrib.ingame_python.utils import register_events, time_event, phrase_event
 
@@ -21,6 +22,7 @@ from logic.character.stats import StatsHandler
 from logic.geo import get_direction
 from typeclasses.shared import AvenewObject
 from world.log import login as log
+from world.utils import cached_property
 
 # Constants
 MAP = r"""
@@ -43,6 +45,33 @@ W{ll}{ll}{ll}{ll}{ll}{ll}{ll}*{rl}{rl}{rl}{rl}{rl}{rl}{rl}E             {ln}
         S                     {bn}
 """
 
+# Translation table escaping the spoken messages, see `at_before_say`
+_SAY_ESCAPE = {ord(u"|"): u"||"}
+
+# Capitalized direction names, indexed by direction number
+_DIRECTION_NAMES = tuple(get_direction(direction)["name"].capitalize()
+        for direction in range(10))
+
+# MAP fields by direction: (direction, line field, line, name field, name prefix)
+_MAP_SLOTS = (
+        (0, "rl", "-", "rn", "E  - "),
+        (1, "hrl", "\\", "hrn", "SE - "),
+        (2, "bl", "|", "bn", "S  - "),
+        (3, "hll", "/", "hln", "SW - "),
+        (4, "ll", "-", "ln", "W  - "),
+        (5, "ell", "\\", "eln", "NW - "),
+        (6, "fl", "|", "fn", "N  - "),
+        (7, "erl", "/", "ern", "NE - "),
+)
+
+# Position of each MAP field in the values built by `format_turns`
+_MAP_INDEXES = dict((field, 2 * i + offset) for i, slot in enumerate(_MAP_SLOTS)
+        for offset, field in ((0, slot[1]), (1, slot[3])))
+
+# MAP split once into (literal text, value index or None) pairs
+_MAP_PARTS = tuple((literal, None if field is None else _MAP_INDEXES[field])
+        for literal, field, _, _ in Formatter().parse(MAP))
+
 
 @register_events
 class Character(AvenewObject, EventCharacter):
@@ -69,17 +98,17 @@ class Character(AvenewObject, EventCharacter):
 
     repr = "representations.character.CharacterRepr"
 
-    @lazy_property
+    @cached_property
     def behaviors(self):
         """Return the behavior handler for this character."""
         return BehaviorHandler(self)
 
-    @lazy_property
+    @cached_property
     def equipment(self):
         """Return the equipment handler for this character."""
         return EquipmentHandler(self)
 
-    @lazy_property
+    @cached_property
     def stats(self):
         """Return the stat handler for this character."""
         return StatsHandler(self)
@@ -110,7 +139,7 @@ class Character(AvenewObject, EventCharacter):
             if hasattr(obj, "types"):
                 types = obj.types.has("notifications")
                 if types:
-                    if types[0].notifications.all():
+                    if types[0].notifications.count():
                         self.msg("|c{} vibrates|n: you have new notifications.".format(obj.get_display_name(self).capitalize()))
 
     def at_before_say(self, message, **kwargs):
@@ -135,8 +164,11 @@ class Character(AvenewObject, EventCharacter):
             message (str): The (possibly modified) text to be spoken.
 
         """
-        # Escape | and {} (color codes and mapping)
-        message = message.replace("|", "||")
+        # Escape | (color codes)
+        if isinstance(message, unicode):
+            message = message.translate(_SAY_ESCAPE)
+        else:
+            message = message.replace("|", "||")
         return super(Character, self).at_before_say(message)
 
     def at_say(self, speech, **kwargs):
@@ -158,47 +190,66 @@ class Character(AvenewObject, EventCharacter):
             return
 
         vehicle.add_message("turns")
-        direction = vehicle.db.direction
-        exits = crossroad.db.exits
         sessions = self.sessions.get()
         if sessions:
-            if any(session.protocol_flags.get(
-                    "SCREENREADER", False) for session in sessions):
-                # One session on the driver has SCREENREADER turned on
-                msg = ""
-                for dir, exit in exits.items():
-                    if msg:
-                        msg += "\n"
-
-                    name = get_direction(dir)["name"].capitalize()
-                    msg += "  {:<10} - {}".format(name, exit["name"])
-            else:
-                # Create the diagram to represent the crossroad
-                msg = MAP.format(
-                        fl="|" if 6 in exits else " ",
-                        fn="N  - " + exits[6]["name"] if 6 in exits else "",
-                        erl="/" if 7 in exits else " ",
-                        ern="NE - " + exits[7]["name"] if 7 in exits else "",
-                        ell="\\" if 5 in exits else " ",
-                        eln="NW - " + exits[5]["name"] if 5 in exits else "",
-                        rl="-" if 0 in exits else " ",
-                        rn="E  - " + exits[0]["name"] if 0 in exits else "",
-                        ll="-" if 4 in exits else " ",
-                        ln="W  - " + exits[4]["name"] if 4 in exits else "",
-                        hrl="\\" if 1 in exits else " ",
-                        hrn="SE - " + exits[1]["name"] if 1 in exits else "",
-                        hll="/" if 3 in exits else " ",
-                        hln="SW - " + exits[3]["name"] if 3 in exits else "",
-                        bl="|" if 2 in exits else " ",
-                        bn="S  - " + exits[2]["name"] if 2 in exits else "",
-                )
+            # The rendered turns are kept on the crossroad until its exits change
+            screenreader = any(session.protocol_flags.get(
+                    "SCREENREADER", False) for session in sessions)
+            turns = crossroad.ndb.turns
+            if turns is None:
+                turns = crossroad.ndb.turns = {}
+
+            msg = turns.get(screenreader)
+            if msg is None:
+                msg = turns[screenreader] = self.format_turns(crossroad, screenreader)
 
             self.msg(msg)
 
+    def format_turns(self, crossroad, screenreader=False):
+        """
+        Return the list of available exits from a crossroad.
+
+        Args:
+            crossroad (Crossroad): the crossroad.
+            screenreader (bool, optional): return a plain list rather
+                    than a diagram.
+
+        Returns:
+            msg (str): the formatted exits.
+
+        """
+        # Read the exit names once from the stored exits
+        names = dict((dir, exit["name"]) for dir, exit in crossroad.db.exits.items())
+        if screenreader:
+            # One session on the driver has SCREENREADER turned on
+            msg = ""
+            for dir, name in names.items():
+                if msg:
+                    msg += "\n"
+
+                msg += "  {:<10} - {}".format(_DIRECTION_NAMES[dir], name)
+        else:
+            # Create the diagram to represent the crossroad
+            values = []
+            for dir, _, line, _, prefix in _MAP_SLOTS:
+                name = names.get(dir)
+                if name is None:
+                    values += (" ", "")
+                else:
+                    values += (line, prefix + name)
+
+            msg = "".join(literal if index is None else literal + values[index]
+                    for literal, index in _MAP_PARTS)
+
+        return msg
+
     def pre_turn(self, vehicle, crossroad):
         """Called to have the driver make a decision regarding turning."""
         from world.log import main as log
-        log.debug("Calling pre_turn X={} Y={} direciton={} crossroad={} {}".format(round(vehicle.db.coords[0], 3), round(vehicle.db.coords[1], 3), vehicle.db.direction, vehicle.db.next_crossroad, crossroad))
+        coords = vehicle.db.coords
+        log.debug("Calling pre_turn X=%.3f Y=%.3f direction=%s crossroad=%s %s",
+                coords[0], coords[1], vehicle.db.direction,
+                vehicle.db.next_crossroad, crossroad)
 
         # Call the 'pre_turn' event on the driver
         self.callbacks.call("pre_turn", self, vehicle, crossroad)
@@ -200,6 +200,17 @@ class Room(AvenewObject, EventRoom):
         if z is not None:
             self.tags.add(str(z), category="coordz")
 
+    @property
+    def roads(self):
+        """Return the list of road names this room is connected to."""
+        roads = self.tags.get(category="road")
+        if roads is None:
+            return []
+        elif isinstance(roads, basestring):
+            return [roads]
+
+        return list(roads)
+
     @property
     def ident(self):
         """Return the room identifier."""
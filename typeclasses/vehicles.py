@@ -20,6 +20,45 @@ from world.log import logger
 DIRECTIONS = NAME_OPP_DIRECTIONS
 log = logger("vehicle")
 
+ROAD_CACHE_SIZE = 100
+
+# Road coordinates already computed, see `Crossroad.get_road_coordinates`
+_ROAD_COORDINATES = OrderedDict()
+
+def invalidate_road(name=None):
+    """
+    Forget the cached coordinates of a road.
+
+    Args:
+        name (str, optional): the road name.  If not set, forget
+                the coordinates of every road.
+
+    """
+    if name is None:
+        _ROAD_COORDINATES.clear()
+        return
+
+    name = name.lower().strip()
+    for key in [key for key in _ROAD_COORDINATES if key[0] == name]:
+        del _ROAD_COORDINATES[key]
+
+def cache_road(key, coordinates):
+    """
+    Cache the coordinates of a road.
+
+    Only the last `ROAD_CACHE_SIZE` computed roads are kept: when the
+    cache is full, the oldest entry is forgotten.
+
+    Args:
+        key (tuple): the cache key, beginning with the road name.
+        coordinates (OrderedDict): the road coordinates.
+
+    """
+    while len(_ROAD_COORDINATES) >= ROAD_CACHE_SIZE:
+        _ROAD_COORDINATES.popitem(last=False)
+
+    _ROAD_COORDINATES[key] = coordinates
+
 class Crossroad(AvenewObject, DefaultObject):
 
     """A crossroad, used to set up the route system.
@@ -141,11 +180,23 @@ class Crossroad(AvenewObject, DefaultObject):
             A sorted dictionary of coordinates as key and additional
             information as values.
 
+        Note:
+            The result is cached until the road is modified through
+            `add_exit` or `del_exit`, or until one of its crossroads
+            is moved or deleted.  It shouldn't be modified by the caller.
+
         """
+        key = (road.lower().strip(), road, city, include_sides,
+                include_road, include_crossroads)
+        coordinates = _ROAD_COORDINATES.get(key)
+        if coordinates is not None:
+            return coordinates
+
         coordinates = OrderedDict()
         crossroads = cls.get_crossroads_road(road, city)
         if not crossroads:
-            return {}
+            cache_road(key, coordinates)
+            return coordinates
 
         first = current = crossroads[0]
         number = 0
@@ -186,8 +237,30 @@ class Crossroad(AvenewObject, DefaultObject):
             visited.append(current)
             current = crossroad
 
+        cache_road(key, coordinates)
         return coordinates
 
+    @classmethod
+    def get_road_number_at(cls, road, x, y, z, city=None):
+        """
+        Return the street numbers on a side of a road, if found.
+
+        Args:
+            road (str): the name of the road.
+            x (int): the X coordinate on a side of the road.
+            y (int): the Y coordinate on a side of the road.
+            z (int): the Z coordinate on a side of the road.
+            city (str, optional): the city name to filter search.
+
+        Returns:
+            The tuple of street numbers at this coordinate, or None
+            if the coordinate isn't on a side of this road.
+
+        """
+        coordinates = cls.get_road_coordinates(road, city,
+                include_road=False, include_crossroads=False)
+        return coordinates.get((x, y, z))
+
     @classmethod
     def get_street(cls, x, y, z, city=None):
         """
@@ -324,6 +397,7 @@ class Crossroad(AvenewObject, DefaultObject):
         if old is not None:
             self.tags.remove(old, category="coordx")
         self.tags.add(str(x), category="coordx")
+        self.invalidate_roads()
     x = property(_get_x, _set_x)
 
     def _get_y(self):
@@ -336,6 +410,7 @@ class Crossroad(AvenewObject, DefaultObject):
         if old is not None:
             self.tags.remove(old, category="coordy")
         self.tags.add(str(y), category="coordy")
+        self.invalidate_roads()
     y = property(_get_y, _set_y)
 
     def _get_z(self):
@@ -348,6 +423,7 @@ class Crossroad(AvenewObject, DefaultObject):
         if old is not None:
             self.tags.remove(old, category="coordz")
         self.tags.add(str(z), category="coordz")
+        self.invalidate_roads()
     z = property(_get_z, _set_z)
 
     @property
@@ -371,6 +447,16 @@ class Crossroad(AvenewObject, DefaultObject):
     def at_object_creation(self):
         self.db.exits = {}
 
+    def at_object_delete(self):
+        """The crossroad is about to be deleted."""
+        self.invalidate_roads()
+        return True
+
+    def invalidate_roads(self):
+        """Forget the cached coordinates of the roads of this crossroad."""
+        for info in (self.db.exits or {}).values():
+            invalidate_road(info["name"])
+
     def get_road(self, name):
         """
         Return the entry representing the road with this name, if found.
@@ -414,6 +500,8 @@ class Crossroad(AvenewObject, DefaultObject):
         """
         log = logger("crossroad")
         lower_name = name.lower().strip()
+        invalidate_road(lower_name)
+        self.ndb.turns = None
         x, y, z = self.x, self.y, self.z
         d_x, d_y, d_z = crossroad.x, crossroad.y, crossroad.z
 
@@ -533,6 +621,8 @@ class Crossroad(AvenewObject, DefaultObject):
         name = None
         if direction in self.db.exits:
             info = self.db.exits.pop(direction)
+            invalidate_road(info["name"])
+            self.ndb.turns = None
             name = info.get(name)
 
             # Remove the coordinate tags
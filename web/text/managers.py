@@ -3,7 +3,7 @@ import datetime
 from collections import OrderedDict
 
 from django.db import models
-from django.db.models import Q, Count
+from django.db.models import Q, Count, IntegerField, OuterRef, Subquery
 from django.utils.timezone import make_aware
 
 # Global imports
@@ -33,8 +33,9 @@ class TextManager(models.Manager):
             raise ValueError("wrong phone number format: {}".format(number))
 
         q = self.filter(db_thread__db_recipients__db_phone_number=number)
-        return q.order_by("-db_date_sent").prefetch_related(
-                "db_sender", "db_thread", "db_thread__db_recipients", "db_thread__db_read")
+        return q.order_by("-db_date_sent").select_related(
+                "db_sender", "db_thread").prefetch_related(
+                "db_thread__db_recipients", "db_thread__db_read")
 
     def get_threads_for(self, number):
         """Return the thread messages for the given number.
@@ -44,15 +45,55 @@ class TextManager(models.Manager):
         method will return a dictionary with thread IDs as key, and
         the most recent text of the thread as value.
 
+        Note:
+            The most recent text of each thread is selected by the
+            database (using a subquery), so that only one text per
+            thread is retrieved.
+
         """
         threads = OrderedDict()
-        for text in self.get_texts_for(number):
-            thread = text.db_thread
-            if thread and thread.id not in threads:
-                threads[thread.id] = text
+        for text in self._get_latest_texts(number):
+            threads[text.db_thread_id] = text
 
         return threads
 
+    def get_threads_and_count_for(self, number):
+        """Return the thread messages and the number of texts for the number.
+
+        This method returns the same dictionary as `get_threads_for`,
+        along with the number of texts sent or received by this number.
+        The number of texts in every thread is retrieved along with its
+        most recent text, so that no additional query is needed to
+        count them.
+
+        Args:
+            number (str): the phone number.
+
+        Returns:
+            threads, count (tuple): `threads` is the dictionary of most
+                    recent texts by thread IDs, `count` the number of
+                    texts in all these threads.
+
+        """
+        in_thread = self.filter(db_thread=OuterRef("db_thread")).order_by()
+        in_thread = in_thread.values("db_thread").annotate(
+                num_texts=Count("id")).values("num_texts")
+        texts = self._get_latest_texts(number).annotate(
+                num_texts=Subquery(in_thread, output_field=IntegerField()))
+        threads = OrderedDict()
+        count = 0
+        for text in texts:
+            threads[text.db_thread_id] = text
+            count += text.num_texts
+
+        return threads, count
+
+    def _get_latest_texts(self, number):
+        """Return the query of the most recent text in every thread of number."""
+        latest = self.filter(db_thread=OuterRef("db_thread")).order_by(
+                "-db_date_sent", "-id").values("id")[:1]
+        return self.get_texts_for(number).filter(id=Subquery(latest))
+
     def get_texts_with(self, numbers):
         """Return the list of texts of these numbers.
 
@@ -105,7 +146,7 @@ class TextManager(models.Manager):
             from web.text.models import Number as _NUMBER
 
         # First, get the sender's phone number
-        recipients = [sender] + recipients
+        recipients = [sender] + list(recipients)
         try:
             sender = _NUMBER.objects.get(db_phone_number=sender)
         except _NUMBER.DoesNotExist:
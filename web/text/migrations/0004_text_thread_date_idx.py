@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.15 on 2026-10-15 10:12
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('text', '0003_restructure'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='text',
+            index=models.Index(fields=['db_thread', '-db_date_sent'], name='text_thread_date_idx'),
+        ),
+    ]
@@ -12,6 +12,42 @@ from web.text.managers import TextManager, ThreadManager
 # Global imports
 _GAMETIME = None
 
+# Translation table removing dashes from unicode phone numbers
+_STRIP_DASHES = {ord("-"): None}
+
+def get_gametime():
+    """Return the current game time as an aware datetime."""
+    global _GAMETIME
+    if not _GAMETIME:
+        from evennia.utils import gametime as _GAMETIME
+
+    gtime = datetime.datetime.fromtimestamp(_GAMETIME.gametime(absolute=True))
+    return make_aware(gtime)
+
+def strip_dashes(number):
+    """Return the phone number without dashes.
+
+    Args:
+        number (str): the phone number, like "555-1234".
+
+    """
+    if isinstance(number, unicode):
+        return number.translate(_STRIP_DASHES)
+
+    return number.replace(b"-", b"")
+
+def format_ago(date, gtime):
+    """Return the human-readable time between date and gtime (X units ago).
+
+    Args:
+        date (datetime): the aware date in the past.
+        gtime (datetime): the aware game time to compare with.
+
+    """
+    seconds = (gtime - date).total_seconds()
+    ago = time_format(seconds, 4)
+    return "{} ago".format(ago)
+
 class Number(SharedMemoryModel):
 
     """A phone number."""
@@ -38,8 +74,8 @@ class Thread(SharedMemoryModel):
             has_read (bool): whether this number has read this thread.
 
         """
-        number = number.replace("-", "")
-        return self.db_read.filter(db_phone_number=number).count() > 0
+        number = strip_dashes(number)
+        return self.db_read.filter(db_phone_number=number).exists()
 
     def mark_unread(self, number):
         """Mark the thread as unread for this number.
@@ -49,9 +85,13 @@ class Thread(SharedMemoryModel):
         Args:
             number (str): the phone number.
 
+        Raises:
+            Number.DoesNotExist: the number doesn't exist.
+
         """
-        number = Number.objects.get(db_phone_number=number.replace("-", ""))
-        self.db_read.remove(number)
+        number_id = Number.objects.values_list("id", flat=True).get(
+                db_phone_number=strip_dashes(number))
+        self.db_read.remove(number_id)
 
     def mark_read(self, number):
         """Mark the thread has read by this number.
@@ -61,9 +101,13 @@ class Thread(SharedMemoryModel):
         Args:
             number (str): the phone number to add.
 
+        Raises:
+            Number.DoesNotExist: the number doesn't exist.
+
         """
-        number = Number.objects.get(db_phone_number=number.replace("-", ""))
-        self.db_read.add(number)
+        number_id = Number.objects.values_list("id", flat=True).get(
+                db_phone_number=strip_dashes(number))
+        self.db_read.add(number_id)
 
 
 class Text(SharedMemoryModel):
@@ -79,29 +123,38 @@ class Text(SharedMemoryModel):
     db_thread = models.ForeignKey(Thread, on_delete=models.CASCADE)
     db_deleted = models.ManyToManyField(Number, related_name='+')
 
+    class Meta:
+        indexes = [
+                models.Index(fields=["db_thread", "-db_date_sent"],
+                        name="text_thread_date_idx"),
+        ]
+
     def __str__(self):
         return "{}: {}".format(self.id, self.content)
 
     @property
     def sent_ago(self):
         """Return the human-readable time since sent (X units ago)."""
-        global _GAMETIME
-        if not _GAMETIME:
-            from evennia.utils import gametime as _GAMETIME
+        return self.sent_ago_from(get_gametime())
 
-        gtime = datetime.datetime.fromtimestamp(_GAMETIME.gametime(absolute=True))
-        gtime = make_aware(gtime)
+    def sent_ago_from(self, gtime):
+        """Return the human-readable time since sent, from a given time.
 
-        seconds = (gtime - self.date_sent).total_seconds()
-        ago = time_format(seconds, 4)
-        return "{} ago".format(ago)
+        When displaying several texts, get the game time once (see
+        `get_gametime`) and call this method for every text.
+
+        Args:
+            gtime (datetime): the aware game time to compare with.
+
+        """
+        return format_ago(self.date_sent, gtime)
 
     @property
     def recipients(self):
         """Return the list of recipients, using the thread."""
         recipients = []
         for recipient in self.db_thread.db_recipients.all():
-            if recipient != self.sender:
+            if recipient.id != self.db_sender_id:
                 recipients.append(recipient.db_phone_number)
 
         return recipients
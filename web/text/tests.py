@@ -121,3 +121,19 @@ class TestText(TestCase):
         t1.thread.mark_unread(self.n2)
         self.assertTrue(t1.thread.has_read(self.n1))
         self.assertFalse(t1.thread.has_read(self.n2))
+
+    def test_threads_and_count_for(self):
+        """Check the get_threads_and_count_for helper."""
+        t1 = Text.objects.send(self.n1, [self.n2], "How do?")
+        t2 = Text.objects.send(self.n2, [self.n1], "Good! You?")
+        t3 = Text.objects.send(self.n3, [self.n1], "Hold!")
+        threads, count = Text.objects.get_threads_and_count_for(self.n1)
+        self.assertEqual(count, 3)
+        self.assertEqual(threads[t1.db_thread_id], t2)
+        self.assertEqual(threads[t3.db_thread_id], t3)
+        threads, count = Text.objects.get_threads_and_count_for(self.n2)
+        self.assertEqual(count, 2)
+        self.assertNotIn(t3.db_thread_id, threads)
+        threads, count = Text.objects.get_threads_and_count_for(self.n3)
+        self.assertEqual(count, 1)
+        self.assertIn(t3.db_thread_id, threads)
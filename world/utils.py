@@ -8,15 +8,70 @@ Functions:
     show_list(strings, width=4, **kwargs): return a formatted list.
     load_YAML(string): read a YAML file, returning a collection with systematic line numbers.
 
+Classes:
+    cached_property: a property computed once and stored on the instance.
+
 """
 
 from yaml import compose_all, nodes
 from collections import OrderedDict
 
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
 _UNICODE_MAPPING = {
     # Insert characters to escape here
 }
 
+# Constructors of YAML scalars, by tag name
+_SCALAR_CONSTRUCTORS = {
+    "float": float,
+    "int": int,
+    "str": lambda value: value,
+}
+
+# Translation tables of the default mapping, by replacement string
+_LATIN_TABLES = {}
+
+class _LatinTable(dict):
+
+    """Translation table used by `latinify`.
+
+    Characters of the mapping are translated to their replacement.
+    Other characters are left untouched if ASCII, or translated to
+    the replacement string otherwise.  Mapping keys of several
+    characters can't be translated: they are kept in `multiple` and
+    replaced before the translation.  Non-ASCII characters in the
+    mapping replacements are themselves replaced, so that the result
+    only contains ASCII.
+
+    """
+
+    def __init__(self, mapping, replace):
+        super(_LatinTable, self).__init__()
+        self.replace = replace
+        self.multiple = []
+        for chars, repl in mapping.items():
+            repl = u"".join(char if ord(char) < 128 else replace for char in repl)
+            if len(chars) == 1:
+                self[ord(chars)] = repl
+            else:
+                self.multiple.append((chars, repl))
+
+    def __missing__(self, code):
+        value = self[code] = code if code < 128 else self.replace
+        return value
+
+    def translate(self, unicode_string):
+        """Return the translated unicode string."""
+        for chars, repl in self.multiple:
+            unicode_string = unicode_string.replace(chars, repl)
+
+        return unicode_string.translate(self)
+
+
 def latinify(unicode_string, replace=u"?", mapping=_UNICODE_MAPPING):
     """
     Return a unicode string containing only ASCII, following a mapping.
@@ -26,19 +81,19 @@ def latinify(unicode_string, replace=u"?", mapping=_UNICODE_MAPPING):
         replace (optional, unicode): the replacement string when the character cannot be
                 found in the mapping and is not ASCII.
         mapping (optional, dict): the mapping with unicode characters as keys
-                and unicode replacements as values.
+                and unicode replacements as values.  Keys can contain
+                several characters, they are replaced before single
+                characters.
 
     """
-    # Replace characters found in the mapping
-    for char, repl in mapping.items():
-        unicode_string = unicode_string.replace(char, repl)
-
-    # Check that unicode_string is all ASCII now
-    for i, char in enumerate(unicode_string):
-        if ord(char) >= 128: # Non-ascii
-            unicode_string = unicode_string[:i] + replace + unicode_string[i + 1:]
+    if mapping is _UNICODE_MAPPING:
+        table = _LATIN_TABLES.get(replace)
+        if table is None:
+            table = _LATIN_TABLES[replace] = _LatinTable(mapping, replace)
+    else:
+        table = _LatinTable(mapping, replace)
 
-    return unicode_string
+    return table.translate(unicode_string)
 
 def show_list(strings, width=4, vertical=False, length=None, begin="",
         between_lines="\n"):
@@ -57,35 +112,29 @@ def show_list(strings, width=4, vertical=False, length=None, begin="",
     give more freedom regarding formatting.
 
     """
-    lines = [[]]
-    i = 0
-    max_length = 0
-
-    # Add the strings horizontally or vertically
-    for entry in strings:
-        line = lines[-1]
-        if len(line) >= width:
-            line = []
-            lines.append(line)
-        line.append(entry)
-        if len(entry) > max_length:
-            max_length = len(entry)
+    strings = list(strings)
+
+    # Split the strings in lines of `width` entries
+    lines = [strings[i:i + width] for i in range(0, len(strings), width)] or [[]]
+    max_length = max(map(len, strings)) if strings else 0
 
     # Create the string
-    ret = ""
+    parts = []
     if length is None:
         length = max_length
+    max_entry = length - 1
+    truncate_at = length - 4
 
     for i, line in enumerate(lines):
         if i != 0:
-            ret += between_lines
-        ret += begin
+            parts.append(between_lines)
+        parts.append(begin)
         for entry in line:
-            if len(entry) > length - 1:
-                entry = entry[:length - 4] + "..."
-            ret += entry.ljust(length)
+            if len(entry) > max_entry:
+                entry = entry[:truncate_at] + "..."
+            parts.append(entry.ljust(length))
 
-    return ret
+    return "".join(parts)
 
 def load_YAML(stream):
     """Load a YAML content, returning the data in a nested tuple.
@@ -98,7 +147,7 @@ def load_YAML(stream):
     the type of value found in the content.
 
     """
-    content = compose_all(stream)
+    content = compose_all(stream, Loader=_YAMLLoader)
     collection = []
     for document in content:
         line = document.start_mark.line + 1
@@ -108,36 +157,69 @@ def load_YAML(stream):
     return collection
 
 def read_node(node):
-    """Recursively read the given YAML piece, returning an appropriate collection."""
-    line = node.start_mark.line + 1
-    if isinstance(node, nodes.ScalarNode):
-        tag = node.tag.split(":")[-1]
-        if tag in ["int", "float"]:
-            constructor = eval(tag)
-            value = constructor(node.value)
-        elif tag == "str":
-            value = node.value
+    """Read the given YAML piece, returning an appropriate collection.
+
+    Nested nodes are read in document order with an explicit stack,
+    so deep documents don't depend on the recursion limit.
+
+    """
+    root = [None]
+    stack = [(node, root, 0)]
+    while stack:
+        node, container, key = stack.pop()
+        line = node.start_mark.line + 1
+        if isinstance(node, nodes.ScalarNode):
+            container[key] = _read_scalar(node, line)
+        elif isinstance(node, nodes.MappingNode):
+            col = container[key] = OrderedDict()
+            children = []
+            for node_name, node_value in node.value:
+                if isinstance(node_name, nodes.ScalarNode):
+                    name = _read_scalar(node_name, node_name.start_mark.line + 1)[0]
+                else:
+                    name = read_node(node_name)[0]
+                col[name] = None
+                children.append((node_value, col, name))
+
+            col["--begin"] = line
+            stack.extend(reversed(children))
+        elif isinstance(node, nodes.SequenceNode):
+            col = container[key] = [None] * len(node.value)
+            stack.extend(reversed([(node_value, col, i) for i, node_value in
+                    enumerate(node.value)]))
         else:
-            raise RuntimeError("cannot parse this scalar at line {}".format(line))
+            raise RuntimeError("cannot parse the node at line {}".format(line))
+
+    return root[0]
+
+def _read_scalar(node, line):
+    """Return the (value, line) tuple of a scalar node."""
+    tag = node.tag.split(":")[-1]
+    constructor = _SCALAR_CONSTRUCTORS.get(tag)
+    if constructor is None:
+        raise RuntimeError("cannot parse this scalar at line {}".format(line))
 
-        return (value, line)
+    return (constructor(node.value), line)
 
-    if isinstance(node, nodes.MappingNode):
-        col = OrderedDict()
-        for node_name, node_value in node.value:
-            name = read_node(node_name)[0]
-            value = read_node(node_value)
-            col[name] = value
+class cached_property(object):
 
-        col["--begin"] = line
-        return col
+    """Decorator to compute a property once per instance.
+
+    Unlike `evennia.utils.utils.lazy_property`, this descriptor doesn't
+    define `__set__`: once computed, the value is stored in the
+    instance's `__dict__` and later accesses don't go through the
+    descriptor at all.
+
+    """
 
-    if isinstance(node, nodes.SequenceNode):
-        col = []
-        for node_value in node.value:
-            value = read_node(node_value)
-            col.append(value)
+    def __init__(self, func):
+        self.func = func
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
 
-        return col
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
 
-    raise RuntimeError("cannot parse the node at line {}".format(line))
+        value = obj.__dict__[self.__name__] = self.func(obj)
+        return value